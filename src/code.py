@@ -1,20 +1,37 @@
 # Harvest Hustle - From Farm to Feast in 90 Seconds!
 # CircuitPython Game for Xiao ESP32C3
 
+import gc
 import time
 import board
 import busio
-import digitalio
+import keypad
 import neopixel
 import displayio
 import terminalio
+import vectorio
+import bitmaptools
 import random
+import struct
 import pwmio
 import microcontroller
 import i2cdisplaybus
 import adafruit_displayio_ssd1306
 import adafruit_adxl34x
-from adafruit_display_text import label
+from adafruit_bus_device.i2c_device import I2CDevice
+from adafruit_display_text import bitmap_label
+
+try:
+    import rotaryio
+except ImportError:
+    rotaryio = None  # Port without rotaryio: encoder edges are scanned by keypad
+
+try:
+    import synthio
+    import audiopwmio
+    import audiomixer
+except ImportError:
+    synthio = None  # Port without PWM audio (ESP32-C3): effects only, as plain PWM tones
 
 # ============================================
 # HIGH SCORE STORAGE (NVM)
@@ -113,86 +130,207 @@ if display is None:
         pass
 
 accelerometer = adafruit_adxl34x.ADXL345(i2c)
-
+accelerometer.data_rate = adafruit_adxl34x.DataRate.RATE_100_HZ
+
+# ADXL345 FIFO in stream mode: the sensor queues up to 32 samples at the
+# fixed data rate and read_accel() drains them in one bus session
+ADXL345_ADDR = 0x53
+ADXL345_DATAX0 = 0x32
+ADXL345_FIFO_CTL = 0x38
+ADXL345_FIFO_STATUS = 0x39
+ADXL345_FIFO_STREAM = 0x80
+ACCEL_SCALE = 0.004 * 9.80665  # m/s^2 per LSB, same as the driver
+
+accel_dev = I2CDevice(i2c, ADXL345_ADDR)
+with accel_dev:
+    accel_dev.write(bytes((ADXL345_FIFO_CTL, ADXL345_FIFO_STREAM)))
+
+# Any strip length works; brightness is applied with gamma in PX_LEVEL
 NUM_PIXELS = 1
-pixels = neopixel.NeoPixel(board.D3, NUM_PIXELS, brightness=0.3, auto_write=False)
-
-# Buzzer setup on D2
-buzzer = pwmio.PWMOut(board.D2, variable_frequency=True, duty_cycle=0)
+pixels = neopixel.NeoPixel(board.D3, NUM_PIXELS, brightness=1.0, auto_write=False)
+
+# Buzzer setup on D2 - music and effects are mixed into one PWM audio
+# stream when the port has it, otherwise effects drive the PWM directly
+AUDIO_RATE = 22050
+if synthio:
+    buzzer = None
+    audio = audiopwmio.PWMAudioOut(board.D2)
+    mixer = audiomixer.Mixer(voice_count=2, sample_rate=AUDIO_RATE, channel_count=1,
+                             bits_per_sample=16, samples_signed=True)
+    audio.play(mixer)
+    mixer.voice[0].level = 0.4  # Music under the effects
+    sfx_synth = synthio.Synthesizer(sample_rate=AUDIO_RATE)
+    mixer.voice[1].play(sfx_synth)
+    sfx_tone = synthio.Note(440)  # Retuned for every effect note
+else:
+    buzzer = pwmio.PWMOut(board.D2, variable_frequency=True, duty_cycle=0)
 
 # Flag for first boot (splash screen)
 first_boot = True
 
-# Encoder setup
-encoder_clk = digitalio.DigitalInOut(board.D0)
-encoder_clk.direction = digitalio.Direction.INPUT
-encoder_clk.pull = digitalio.Pull.UP
-
-encoder_dt = digitalio.DigitalInOut(board.D1)
-encoder_dt.direction = digitalio.Direction.INPUT
-encoder_dt.pull = digitalio.Pull.UP
-
-# Button setup with manual debounce
-btn_pin = digitalio.DigitalInOut(board.D6)
-btn_pin.direction = digitalio.Direction.INPUT
-btn_pin.pull = digitalio.Pull.UP
-
-prev_btn_state = True  # True = not pressed
-last_btn_change_time = 0
-DEBOUNCE_TIME = 0.05  # 50ms debounce
+# Encoder setup - counted in the background by rotaryio when available.
+# DT leads CLK when turning clockwise, so it is pin A to make CW count up.
+if rotaryio:
+    encoder = rotaryio.IncrementalEncoder(board.D1, board.D0)
+else:
+    # No pulse counter (ESP32-C3): scan CLK and DT in the background instead,
+    # so edges queue up between frames. Key 0 is CLK, key 1 is DT, and a
+    # "press" is the pin going low.
+    encoder = None
+    encoder_pins = keypad.Keys((board.D0, board.D1), value_when_pressed=False,
+                               pull=True, interval=0.001)
+    encoder_event = keypad.Event()
+
+# Button setup - scanned and debounced in the background; presses and
+# releases queue up until poll_input() moves them to the event queue
+buttons = keypad.Keys((board.D6,), value_when_pressed=False, pull=True, interval=0.02)
+btn_event = keypad.Event()  # Reused for every event read
 
 # ============================================
 # BUZZER SOUND FUNCTIONS
 # ============================================
-def play_tone(frequency, duration):
-    """Play a single tone"""
-    buzzer.frequency = frequency
-    buzzer.duty_cycle = 32768  # 50% duty cycle
-    time.sleep(duration)
-    buzzer.duty_cycle = 0
+# Each effect is a flat (frequency, seconds, ...) table; frequency 0 is a rest
+SFX_SPLASH = (440, 0.05, 554, 0.05, 659, 0.1)
+SFX_COLLECT = (880, 0.05, 1100, 0.05)  # A5 C#6 - short happy beep
+SFX_FAIL = (200, 0.1, 150, 0.15)  # Low buzz
+SFX_START = (523, 0.1, 659, 0.1, 784, 0.1, 1047, 0.15)  # C5 E5 G5 C6 - ascending
+SFX_GAME_OVER = (392, 0.15, 330, 0.15, 262, 0.2)  # G4 E4 C4 - descending
+SFX_WIN = (523, 0.1, 659, 0.1, 784, 0.1, 1047, 0.1, 0, 0.05, 784, 0.1, 1047, 0.2)
+SFX_LEVEL_CLEAR = (784, 0.1, 988, 0.1, 1175, 0.15)  # G5 B5 D6
+SFX_SELECT = (600, 0.03)  # Click
+SFX_QUEUE_SIZE = 4
+
+# Tone sequencer: update_sound() advances the effect once per tick
+sfx_notes = None  # Effect playing now
+sfx_pos = 0  # Index of the current note's frequency in sfx_notes
+sfx_next = 0.0  # When the current note ends
+sfx_queue = []  # Effects waiting behind the current one
+
+def sfx_length(notes):
+    """Total seconds an effect plays for"""
+    return sum(notes[1::2])
+
+def play_sfx(notes, preempt=False):
+    """Start an effect, either cutting off what plays (preempt) or queued after it.
+    Returns the seconds until it finishes."""
+    global sfx_notes, sfx_next
+    now = time.monotonic()
+    if preempt or sfx_notes is None:
+        sfx_queue.clear()
+        sfx_notes = notes
+        sfx_next = now
+        start_note(0, now)
+        return sfx_length(notes)
+    if len(sfx_queue) >= SFX_QUEUE_SIZE:
+        sfx_queue.pop(0)
+    sfx_queue.append(notes)
+    left = sfx_next - now + sfx_length(sfx_notes[sfx_pos + 2:])
+    for queued in sfx_queue:
+        left += sfx_length(queued)
+    return left
+
+def tone_on(freq):
+    if buzzer:
+        buzzer.frequency = freq
+        buzzer.duty_cycle = 32768  # 50% duty cycle
+    else:
+        sfx_tone.frequency = freq
+        sfx_synth.press(sfx_tone)
+
+def tone_off():
+    if buzzer:
+        buzzer.duty_cycle = 0
+    else:
+        sfx_synth.release(sfx_tone)
+
+def start_note(pos, start):
+    """Sound note pos of the current effect, starting at time start"""
+    global sfx_pos, sfx_next
+    sfx_pos = pos
+    freq = sfx_notes[pos]
+    if freq:
+        tone_on(freq)
+    else:
+        tone_off()
+    sfx_next = start + sfx_notes[pos + 1]
+
+def update_sound(now):
+    """Move to the next note or queued effect once the current note is over"""
+    global sfx_notes
+    while sfx_notes is not None and now >= sfx_next:
+        if sfx_pos + 2 < len(sfx_notes):
+            start_note(sfx_pos + 2, sfx_next)
+        elif sfx_queue:
+            sfx_notes = sfx_queue.pop(0)
+            start_note(0, sfx_next)
+        else:
+            sfx_notes = None
+            tone_off()
 
 def sound_collect():
-    """Sound for collecting an ingredient - short happy beep"""
-    play_tone(880, 0.05)  # A5
-    play_tone(1100, 0.05)  # C#6
+    """Sound for collecting an ingredient; cuts off anything playing"""
+    return play_sfx(SFX_COLLECT, preempt=True)
 
 def sound_fail():
-    """Sound for wrong move or penalty - low buzz"""
-    play_tone(200, 0.1)
-    play_tone(150, 0.15)
+    """Sound for wrong move or penalty; cuts off anything playing"""
+    return play_sfx(SFX_FAIL, preempt=True)
 
 def sound_start():
-    """Sound for game start - ascending tune"""
-    play_tone(523, 0.1)   # C5
-    play_tone(659, 0.1)   # E5
-    play_tone(784, 0.1)   # G5
-    play_tone(1047, 0.15) # C6
+    """Sound for game start"""
+    return play_sfx(SFX_START)
 
 def sound_game_over():
-    """Sound for game over - descending sad tune"""
-    play_tone(392, 0.15)  # G4
-    play_tone(330, 0.15)  # E4
-    play_tone(262, 0.2)   # C4
+    """Sound for game over"""
+    return play_sfx(SFX_GAME_OVER)
 
 def sound_win():
     """Sound for winning - victory fanfare"""
-    play_tone(523, 0.1)   # C5
-    play_tone(659, 0.1)   # E5
-    play_tone(784, 0.1)   # G5
-    play_tone(1047, 0.1)  # C6
-    time.sleep(0.05)
-    play_tone(784, 0.1)   # G5
-    play_tone(1047, 0.2)  # C6
+    return play_sfx(SFX_WIN)
 
 def sound_level_clear():
     """Sound for level complete"""
-    play_tone(784, 0.1)   # G5
-    play_tone(988, 0.1)   # B5
-    play_tone(1175, 0.15) # D6
+    return play_sfx(SFX_LEVEL_CLEAR)
 
 def sound_select():
-    """Sound for menu selection - click"""
-    play_tone(600, 0.03)
+    """Sound for menu selection"""
+    return play_sfx(SFX_SELECT, preempt=True)
+
+# Background music: each level's tune loops in the audio hardware while it is
+# played, with no per-note work. Without synthio there is no music.
+MUSIC_TEMPO = 5  # Eighth notes per second
+music_tracks = {}  # Tune -> synthio.MidiTrack, built once
+music_playing = None
+
+def tune_to_midi(tune):
+    """MIDI events for a tune of (note, eighths) pairs; note 0 is a rest"""
+    midi = bytearray()
+    rest = 0
+    for i in range(0, len(tune), 2):
+        note, length = tune[i], tune[i + 1]
+        if note == 0:
+            rest += length
+            continue
+        # Delta times are all below 128, so each fits in one byte
+        midi += bytes((rest, 0x90, note, 100, length, 0x80, note, 0))
+        rest = 0
+    if rest:
+        midi += bytes((rest, 0x80, 0, 0))  # Hold a trailing rest
+    return midi
+
+def play_music(tune):
+    """Loop a tune in the background, or stop the music when tune is None"""
+    global music_playing
+    if not synthio or tune is music_playing:
+        return
+    music_playing = tune
+    if tune is None:
+        mixer.voice[0].stop()
+        return
+    track = music_tracks.get(tune)
+    if track is None:
+        track = synthio.MidiTrack(tune_to_midi(tune), tempo=MUSIC_TEMPO, sample_rate=AUDIO_RATE)
+        music_tracks[tune] = track
+    mixer.voice[0].play(track, loop=True)
 
 # ============================================
 # ICONS (8x8 bitmaps)
@@ -540,51 +678,67 @@ ICON_DATA = {
     ],
 }
 
-def make_icon(name):
-    data = ICON_DATA.get(name, ICON_DATA["default"])
-    bmp = displayio.Bitmap(8, 8, 2)
-    pal = displayio.Palette(2)
-    pal[0] = 0x000000
-    pal[1] = 0xFFFFFF
-    for y in range(8):
-        row = data[y]
-        for x in range(8):
-            if row & (1 << (7 - x)):
-                bmp[x, y] = 1
-    return bmp, pal
+# One monochrome palette shared by every icon
+ICON_PALETTE = displayio.Palette(2)
+ICON_PALETTE[0] = 0x000000
+ICON_PALETTE[1] = 0xFFFFFF
+
+# All icons packed side by side into one 8px-high sprite sheet
+ICON_NAMES = list(ICON_DATA)
+ICON_INDEX = {name: i for i, name in enumerate(ICON_NAMES)}
+ICON_ATLAS = displayio.Bitmap(8 * len(ICON_NAMES), 8, 2)
+for _i, _name in enumerate(ICON_NAMES):
+    for _y, _row in enumerate(ICON_DATA[_name]):
+        for _x in range(8):
+            if _row & (1 << (7 - _x)):
+                ICON_ATLAS[_i * 8 + _x, _y] = 1
+
+def icon_index(name):
+    """Tile index of an icon in ICON_ATLAS"""
+    return ICON_INDEX.get(name, ICON_INDEX["default"])
+
+def make_icon(name, x=0, y=0):
+    """1x1 TileGrid showing one icon from the shared atlas"""
+    return displayio.TileGrid(ICON_ATLAS, pixel_shader=ICON_PALETTE,
+                              tile_width=8, tile_height=8,
+                              default_tile=icon_index(name), x=x, y=y)
 
 def show_splash():
     """Animated splash screen with roaming food ingredients"""
     # Food icons to animate
     foods = ["egg", "milk", "bacon", "tomato", "cheese", "fish", "carrot", "apple"]
     
+    # Scene is built once; frames only move the food TileGrids
+    g = displayio.Group()
+    
+    # Title text
+    t1 = "HARVEST HUSTLE"
+    g.append(make_label(t1, 14, 32))
+    
     # Initial positions and velocities for each food
     items = []
     for i, food in enumerate(foods):
+        x = random.randint(10, 110)
+        y = random.randint(10, 50)
+        tg = make_icon(food, x, y)
+        g.append(tg)
         items.append({
-            "name": food,
-            "x": random.randint(10, 110),
-            "y": random.randint(10, 50),
+            "tg": tg,
+            "x": x,
+            "y": y,
             "vx": random.choice([-2, -1, 1, 2]),
             "vy": random.choice([-2, -1, 1, 2])
         })
+    display.root_group = g
     
-    # Play startup sound
-    play_tone(440, 0.05)
-    play_tone(554, 0.05)
-    play_tone(659, 0.1)
+    # Play startup sound while the icons bounce
+    play_sfx(SFX_SPLASH)
     
     # Animate for 2 seconds
     start_time = time.monotonic()
     frame = 0
     while time.monotonic() - start_time < 2.0:
-        g = displayio.Group()
-        
-        # Title text
-        t1 = "HARVEST HUSTLE"
-        g.append(label.Label(terminalio.FONT, text=t1, color=0xFFFFFF, x=14, y=32))
-        
-        # Update and draw each food item
+        # Update and move each food item
         for item in items:
             # Update position
             item["x"] += item["vx"]
@@ -600,33 +754,19 @@ def show_splash():
             item["x"] = max(0, min(120, item["x"]))
             item["y"] = max(0, min(56, item["y"]))
             
-            # Draw icon
-            bmp, pal = make_icon(item["name"])
-            tg = displayio.TileGrid(bmp, pixel_shader=pal, x=int(item["x"]), y=int(item["y"]))
-            g.append(tg)
-        
-        display.root_group = g
+            # Move icon
+            item["tg"].x = item["x"]
+            item["tg"].y = item["y"]
         
         # LED animation - rainbow effect
-        for i in range(NUM_PIXELS):
-            hue = (frame * 10 + i * 32) % 256
-            if hue < 85:
-                r, g_c, b = 255 - hue * 3, hue * 3, 0
-            elif hue < 170:
-                hue -= 85
-                r, g_c, b = 0, 255 - hue * 3, hue * 3
-            else:
-                hue -= 170
-                r, g_c, b = hue * 3, 0, 255 - hue * 3
-            pixels[i] = (r, g_c, b)
-        pixels.show()
+        px_rainbow(frame * 10)
         
         frame += 1
+        update_sound(time.monotonic())
         time.sleep(0.05)
     
     # Clear LEDs
-    pixels.fill((0, 0, 0))
-    pixels.show()
+    px_off()
 
 # ============================================
 # CONSTANTS
@@ -638,9 +778,15 @@ COLOR_YELLOW = (255, 255, 0)
 COLOR_BLUE = (0, 0, 255)
 COLOR_PURPLE = (128, 0, 128)
 
-TILT_THRESHOLD = 4.0
+TILT_DEAD_ZONE = 1.5  # m/s^2 of tilt ignored around level
+TILT_FULL = 7.0  # m/s^2 of tilt that reaches full speed
+TILT_MAX_SPEED = 120  # px/s
+TILT_FILTER = 0.25  # Low-pass weight of each new sample (100 Hz)
+TILT_LUT_SCALE = 4  # Response curve entries per m/s^2
 SHAKE_THRESHOLD = 18.0
-MOVE_DEBOUNCE = 0.1
+SHAKE_WINDOW = 8  # Samples (80 ms at 100 Hz) a shake is judged over
+SHAKE_HITS = 2  # Samples in the window above threshold to count as a shake
+SHAKE_REFRACTORY = 40  # Samples (0.4 s) before another shake can fire
 TOUCH_TIME = 0.6  # Time to touch animal (shortened)
 ROTATE_NEEDED = 5  # Rotations needed
 
@@ -652,9 +798,28 @@ DIFFICULTY = {
 
 # Collection methods: "tilt", "shake", "touch", "rotate", "tree"
 # "touch" = stay near animal, "rotate" = approach + rotate encoder, "tree" = shake near tree
+# Level tunes: (MIDI note, eighths) pairs, note 0 is a rest
+TUNE_MORNING = bytes((
+    72, 2, 76, 2, 79, 2, 76, 2, 77, 2, 74, 2, 71, 4,
+    72, 2, 74, 2, 76, 2, 72, 2, 74, 4, 0, 4,
+))
+TUNE_GARDEN = bytes((
+    67, 1, 69, 1, 71, 2, 74, 2, 71, 2, 69, 2, 67, 2, 64, 4,
+    67, 1, 69, 1, 71, 2, 72, 2, 71, 2, 69, 4, 0, 4,
+))
+TUNE_WATER = bytes((
+    62, 3, 65, 1, 69, 4, 67, 3, 65, 1, 64, 4,
+    62, 3, 64, 1, 65, 2, 64, 2, 62, 4, 0, 4,
+))
+TUNE_KITCHEN = bytes((
+    60, 1, 60, 1, 67, 2, 64, 1, 64, 1, 72, 2, 71, 2, 67, 2, 69, 4,
+    65, 1, 65, 1, 69, 2, 67, 2, 64, 2, 62, 2, 60, 4, 0, 2,
+))
+
 LEVELS = [
     {  # Level 1
         "name": "Sunny Morning",
+        "music": TUNE_MORNING,
         "view": "side",
         "ingredients": [
             ("egg", 2, "tilt"),
@@ -666,6 +831,7 @@ LEVELS = [
     },
     {  # Level 2
         "name": "Pancake Prep",
+        "music": TUNE_MORNING,
         "view": "side",
         "ingredients": [
             ("egg", 2, "tilt"),
@@ -677,6 +843,7 @@ LEVELS = [
     },
     {  # Level 3
         "name": "Full Breakfast",
+        "music": TUNE_MORNING,
         "view": "topdown",
         "ingredients": [
             ("bacon", 2, "touch"),
@@ -689,6 +856,7 @@ LEVELS = [
     },
     {  # Level 4
         "name": "Healthy Bowl",
+        "music": TUNE_GARDEN,
         "view": "topdown",
         "ingredients": [
             ("milk", 2, "touch"),
@@ -703,6 +871,7 @@ LEVELS = [
     },
     {  # Level 5
         "name": "Poultry Chase",
+        "music": TUNE_GARDEN,
         "view": "topdown",
         "ingredients": [
             ("duck", 3, "touch"),
@@ -714,6 +883,7 @@ LEVELS = [
     },
     {  # Level 6
         "name": "Lakeside",
+        "music": TUNE_WATER,
         "view": "topdown",
         "ingredients": [
             ("fish", 3, "tilt"),
@@ -728,6 +898,7 @@ LEVELS = [
     },
     {  # Level 7
         "name": "Hearty Stew",
+        "music": TUNE_KITCHEN,
         "view": "topdown",
         "ingredients": [
             ("bacon", 3, "touch"),
@@ -740,6 +911,7 @@ LEVELS = [
     },
     {  # Level 8
         "name": "Pizza Time",
+        "music": TUNE_KITCHEN,
         "view": "topdown",
         "ingredients": [
             ("cheese", 3, "tilt"),
@@ -754,6 +926,7 @@ LEVELS = [
     },
     {  # Level 9
         "name": "Thanksgiving",
+        "music": TUNE_KITCHEN,
         "view": "topdown",
         "ingredients": [
             ("turkey", 4, "touch"),
@@ -768,6 +941,7 @@ LEVELS = [
     },
     {  # Level 10
         "name": "Ocean Bounty",
+        "music": TUNE_WATER,
         "view": "topdown",
         "ingredients": [
             ("fish", 4, "tilt"),
@@ -783,6 +957,7 @@ LEVELS = [
     },
     {  # Level 11
         "name": "Gourmet",
+        "music": TUNE_KITCHEN,
         "view": "topdown",
         "ingredients": [
             ("lamb", 4, "touch"),
@@ -823,14 +998,12 @@ class Game:
         self.waves_y = []
         self.cook_progress = 0
         self.cook_progress2 = 0
-        self.last_move = 0
         self.scroll_offset = 0
         self.touch_target = None
         self.touch_start = 0
         self.rotate_target = None
         self.rotate_count = 0
         self.penalty = 0
-        self.last_scroll = 0
         self.last_btn_time = 0
         self.intro_page = 0
         self.over_choice = 0  # 0=Retry, 1=Restart
@@ -852,53 +1025,260 @@ game = Game()
 # ============================================
 # INPUT
 # ============================================
+class Gestures:
+    """Shake and tilt recognizer over a ring buffer of accelerometer samples"""
+
+    def __init__(self, window, hits, refractory):
+        self.window = [False] * window  # Sample over shake threshold?
+        self.head = 0
+        self.count = 0  # True entries in the window
+        self.hits = hits
+        self.refractory = refractory
+        self.cooldown = 0  # Samples left before a shake may fire again
+        self.limit_sq = SHAKE_THRESHOLD * SHAKE_THRESHOLD
+        self.x = 0.0  # Low-pass filtered tilt
+        self.y = 0.0
+
+    def add(self, x, y, z):
+        """Feed one sample; return True if it completes a shake"""
+        self.x += (x - self.x) * TILT_FILTER
+        self.y += (y - self.y) * TILT_FILTER
+        over = x * x + y * y + z * z > self.limit_sq
+        if self.window[self.head]:
+            self.count -= 1
+        self.window[self.head] = over
+        if over:
+            self.count += 1
+        self.head = (self.head + 1) % len(self.window)
+        if self.cooldown:
+            self.cooldown -= 1
+            return False
+        if self.count >= self.hits:
+            self.cooldown = self.refractory
+            return True
+        return False
+
+gestures = Gestures(SHAKE_WINDOW, SHAKE_HITS, SHAKE_REFRACTORY)
+
+def build_tilt_curve():
+    """Speed in px/s for each TILT_LUT_SCALE step of tilt, zero in the dead zone"""
+    curve = []
+    span = TILT_FULL - TILT_DEAD_ZONE
+    for i in range(int(TILT_FULL * TILT_LUT_SCALE) + 1):
+        a = i / TILT_LUT_SCALE - TILT_DEAD_ZONE
+        curve.append(0 if a <= 0 else int(TILT_MAX_SPEED * (a / span) ** 1.5))
+    return curve
+
+TILT_CURVE = build_tilt_curve()
+
+def tilt_speed(a):
+    """Signed speed for a filtered tilt reading, through the response curve"""
+    i = min(int(abs(a) * TILT_LUT_SCALE), len(TILT_CURVE) - 1)
+    return TILT_CURVE[i] if a > 0 else -TILT_CURVE[i]
+
+accel_reg = bytearray(1)
+accel_buf = bytearray(6)
+
 def read_accel():
-    x, y, z = accelerometer.acceleration
-    total = (x**2 + y**2 + z**2) ** 0.5
-    
-    if total > SHAKE_THRESHOLD:
-        return "SHAKE"
-    # Original mapping
-    if abs(x) > TILT_THRESHOLD and abs(x) > abs(y):
-        return "RIGHT" if x > 0 else "LEFT"
-    if abs(y) > TILT_THRESHOLD and abs(y) > abs(x):
-        return "FWD" if y > 0 else "BACK"
-    return None
+    """Drain the FIFO into the recognizer; return True on a shake event"""
+    shake = False
+    with accel_dev:
+        accel_reg[0] = ADXL345_FIFO_STATUS
+        accel_dev.write_then_readinto(accel_reg, accel_buf, in_end=1)
+        entries = accel_buf[0] & 0x3F
+        accel_reg[0] = ADXL345_DATAX0
+        # Each 6-byte read of DATAX0..DATAZ1 pops one FIFO entry
+        for _ in range(entries):
+            accel_dev.write_then_readinto(accel_reg, accel_buf)
+            x, y, z = struct.unpack("<hhh", accel_buf)
+            if gestures.add(x * ACCEL_SCALE, y * ACCEL_SCALE, z * ACCEL_SCALE):
+                shake = True
+    return shake
 
 # Encoder tracking
-last_encoder_clk = True
+last_encoder_pos = 0
+encoder_state = 3  # (CLK << 1) | DT after the last scanned edge, both high at rest
+encoder_quarters = 0
+
+# Quadrature step for each (previous state << 2 | new state); CW is +1.
+# Bounce steps back and forth and cancels out; a jump of both bits is 0.
+QUAD_STEPS = (0, 1, -1, 0, -1, 0, 0, 1, 1, 0, 0, -1, 0, -1, 1, 0)
+
+def quad_step(state):
+    """Count the quarter step from the last encoder state to state"""
+    global encoder_state, encoder_quarters
+    encoder_quarters += QUAD_STEPS[(encoder_state << 2) | state]
+    encoder_state = state
 
 def read_encoder():
-    global last_encoder_clk, prev_btn_state, last_btn_change_time
-    rot = 0
-    btn = False
-    
-    # Button with manual debounce
-    cur_state = btn_pin.value
+    """Signed detents turned since the last call (CW > 0)"""
+    global last_encoder_pos, encoder_quarters
+    
+    # Encoder rotation - both directions, never blocks
+    if encoder:
+        pos = encoder.position
+        rot = pos - last_encoder_pos
+        last_encoder_pos = pos
+    else:
+        # Replay the scanned edges through the Gray-code table. Edges from
+        # one scan share a timestamp and are applied together, so pins that
+        # changed in the same scan never count as a step the wrong way.
+        state = encoder_state
+        stamp = None
+        while encoder_pins.events.get_into(encoder_event):
+            if encoder_event.timestamp != stamp:
+                quad_step(state)
+                stamp = encoder_event.timestamp
+            bit = 2 if encoder_event.key_number == 0 else 1
+            state = state & ~bit if encoder_event.pressed else state | bit
+        quad_step(state)
+        # A detent is a full cycle of 4 quarter steps
+        rot = int(encoder_quarters / 4)
+        encoder_quarters -= rot * 4
+    
+    return rot
+
+# Input events: devices are sampled at a fixed rate, independent of
+# rendering, into a bounded ring buffer that each frame drains
+INPUT_PERIOD = 0.005  # 200 Hz for the button and encoder
+# The accelerometer FIFO is drained less often: at 100 Hz it holds two
+# samples by then, and each drain costs a FIFO_STATUS read on the bus
+# shared with the display
+ACCEL_PERIOD = 0.02
+EVENT_QUEUE_SIZE = 32
+
+EV_ROTATE = 0   # value: signed detents
+EV_PRESS = 1
+EV_RELEASE = 2
+EV_SHAKE = 3
+EV_TILT_X = 4   # value: new sideways speed in px/s
+EV_TILT_Y = 5   # value: new forward speed in px/s
+
+# [kind, value, time] slots, allocated once and reused
+event_queue = [[0, 0, 0.0] for _ in range(EVENT_QUEUE_SIZE)]
+event_head = 0  # Oldest queued event
+event_count = 0
+next_sample = 0.0
+next_accel = 0.0
+sampled_vx = 0  # Tilt speeds as last queued
+sampled_vy = 0
+
+# Input state as of the last event drained
+btn_held = False
+tilt_vx = 0
+tilt_vy = 0
+
+def drop_event(n):
+    """Remove the n-th queued event, closing the gap behind it"""
+    global event_count
+    for k in range(n, event_count - 1):
+        a = (event_head + k) % EVENT_QUEUE_SIZE
+        b = (a + 1) % EVENT_QUEUE_SIZE
+        event_queue[a], event_queue[b] = event_queue[b], event_queue[a]
+    event_count -= 1
+
+def push_event(kind, value, t):
+    """Queue an event. A tilt change replaces a pending one on its axis, so
+    each axis holds at most one slot. When the buffer is full the oldest
+    rotation or shake makes room; presses, releases and tilt are never evicted."""
+    global event_count
+    if kind == EV_ROTATE and event_count:
+        # Merge into a rotation still waiting at the back of the queue
+        last = event_queue[(event_head + event_count - 1) % EVENT_QUEUE_SIZE]
+        if last[0] == EV_ROTATE:
+            last[1] += value
+            return
+    if kind == EV_TILT_X or kind == EV_TILT_Y:
+        # Tilt is a level, not a count: only its newest value matters. The
+        # stale one is removed and the new one queued at the back, which
+        # keeps the queue in time order.
+        for k in range(event_count):
+            if event_queue[(event_head + k) % EVENT_QUEUE_SIZE][0] == kind:
+                drop_event(k)
+                break
+    if event_count == EVENT_QUEUE_SIZE:
+        for k in range(event_count):
+            if event_queue[(event_head + k) % EVENT_QUEUE_SIZE][0] in (EV_ROTATE, EV_SHAKE):
+                drop_event(k)
+                break
+        else:
+            return  # Nothing that may be evicted; drop the new event instead
+    slot = event_queue[(event_head + event_count) % EVENT_QUEUE_SIZE]
+    slot[0] = kind
+    slot[1] = value
+    slot[2] = t
+    event_count += 1
+
+def poll_input():
+    """Sample the button and encoder once per INPUT_PERIOD and the
+    accelerometer once per ACCEL_PERIOD, queueing what changed"""
+    global next_sample, next_accel, sampled_vx, sampled_vy
     now = time.monotonic()
+    if now < next_sample:
+        return
+    next_sample = now + INPUT_PERIOD
     
-    if cur_state != prev_btn_state and (now - last_btn_change_time) > DEBOUNCE_TIME:
-        last_btn_change_time = now
-        if not cur_state:  # Button pressed (HIGH -> LOW)
-            btn = True
-        prev_btn_state = cur_state
+    while buttons.events.get_into(btn_event):
+        push_event(EV_PRESS if btn_event.pressed else EV_RELEASE, 0, now)
     
-    # Encoder rotation - only detect clockwise (CW)
-    for _ in range(3):
-        clk = encoder_clk.value
-        dt = encoder_dt.value
-        
-        # Detect on CLK falling edge
-        if last_encoder_clk and not clk:
-            # Swap: now detect the other direction as CW
-            if not dt:
-                rot = 1   # CW - move down
-            # else: ignore
-        
-        last_encoder_clk = clk
-        time.sleep(0.002)
+    rot = read_encoder()
+    if rot:
+        push_event(EV_ROTATE, rot, now)
     
-    return rot, btn
+    if now < next_accel:
+        return
+    next_accel = now + ACCEL_PERIOD
+    if read_accel():
+        push_event(EV_SHAKE, 0, now)
+    vx = tilt_speed(gestures.x)
+    if vx != sampled_vx:
+        sampled_vx = vx
+        push_event(EV_TILT_X, vx, now)
+    vy = tilt_speed(gestures.y)
+    if vy != sampled_vy:
+        sampled_vy = vy
+        push_event(EV_TILT_Y, vy, now)
+
+def next_input():
+    """Drain queued events up to and including the next press; return (rot, btn, shake)"""
+    global event_head, event_count, btn_held, tilt_vx, tilt_vy
+    rot = 0
+    btn = False
+    shake = False
+    while event_count:
+        ev = event_queue[event_head]
+        event_head = (event_head + 1) % EVENT_QUEUE_SIZE
+        event_count -= 1
+        kind = ev[0]
+        if kind == EV_ROTATE:
+            rot += ev[1]
+        elif kind == EV_PRESS:
+            btn = True
+            btn_held = True
+            break  # A second press waits for the next frame
+        elif kind == EV_RELEASE:
+            btn_held = False
+        elif kind == EV_SHAKE:
+            shake = True
+        elif kind == EV_TILT_X:
+            tilt_vx = ev[1]
+        elif kind == EV_TILT_Y:
+            tilt_vy = ev[1]
+    return rot, btn, shake
+
+def wait(seconds):
+    """Pause without missing input: devices keep being sampled meanwhile"""
+    end = time.monotonic() + seconds
+    while True:
+        poll_input()
+        now = time.monotonic()
+        update_fx(now)
+        update_sound(now)
+        update_px(now)
+        left = end - now
+        if left <= 0:
+            return
+        time.sleep(min(left, INPUT_PERIOD))
 
 # ============================================
 # DISPLAY HELPERS
@@ -906,81 +1286,287 @@ def read_encoder():
 def center_x(text):
     return max(0, (128 - len(text) * 6) // 2)
 
+# One palette shared by every rectangle and box
+SHAPE_PALETTE = displayio.Palette(2)
+SHAPE_PALETTE[0] = 0x000000
+SHAPE_PALETTE[1] = 0xFFFFFF
+
 def make_rect(w, h, fill=True):
+    """Filled or outlined rectangle bitmap, drawn with native fills"""
     bmp = displayio.Bitmap(w, h, 2)
-    pal = displayio.Palette(2)
-    pal[0] = 0x000000
-    pal[1] = 0xFFFFFF
-    if fill:
-        for x in range(w):
-            for y in range(h):
-                bmp[x, y] = 1
-    else:
-        for x in range(w):
-            bmp[x, 0] = 1
-            bmp[x, h-1] = 1
-        for y in range(h):
-            bmp[0, y] = 1
-            bmp[w-1, y] = 1
-    return bmp, pal
+    bmp.fill(1)
+    if not fill and w > 2 and h > 2:
+        bitmaptools.fill_region(bmp, 1, 1, w - 1, h - 1, 0)
+    return bmp, SHAPE_PALETTE
+
+def make_box(x, y, w, h):
+    """Solid white vectorio rectangle; move with x/y and resize with width/height"""
+    return vectorio.Rectangle(pixel_shader=SHAPE_PALETTE, color_index=1,
+                              width=w, height=h, x=x, y=y)
+
+class ProgressBar:
+    """Outlined bar drawn into one fixed bitmap; set() only rewrites changed columns"""
+    def __init__(self, x, y, w, h, pad, min_fill=0):
+        self.bitmap, pal = make_rect(w, h, False)
+        self.tilegrid = displayio.TileGrid(self.bitmap, pixel_shader=pal, x=x, y=y)
+        self.pad = pad
+        self.inner = w - 2 * pad
+        self.min_fill = min_fill  # Fills this narrow or less are not drawn
+        self.filled = 0
+
+    def set(self, fraction):
+        fw = int(self.inner * min(1.0, fraction))
+        if fw <= self.min_fill:
+            fw = 0
+        if fw == self.filled:
+            return
+        lo = min(fw, self.filled)
+        hi = max(fw, self.filled)
+        bitmaptools.fill_region(self.bitmap, self.pad + lo, self.pad,
+                                self.pad + hi, self.bitmap.height - self.pad,
+                                1 if fw > self.filled else 0)
+        self.filled = fw
+
+def make_label(text, x, y):
+    """White text rendered into a single bitmap (one TileGrid per label)"""
+    return bitmap_label.Label(terminalio.FONT, text=text, color=0xFFFFFF, x=x, y=y)
+
+# Transparent-background palette for glyph-blitted text
+TEXT_PALETTE = displayio.Palette(2)
+TEXT_PALETTE[0] = 0x000000
+TEXT_PALETTE[1] = 0xFFFFFF
+TEXT_PALETTE.make_transparent(0)
+
+# Source rectangles of terminalio glyphs: char -> (bitmap, x1, y1, x2, y2)
+glyph_cache = {}
+
+def glyph_rect(c):
+    rect = glyph_cache.get(c)
+    if rect is None:
+        glyph = terminalio.FONT.get_glyph(ord(c))
+        if glyph is None:
+            return None
+        cols = glyph.bitmap.width // glyph.width
+        sx = (glyph.tile_index % cols) * glyph.width
+        sy = (glyph.tile_index // cols) * glyph.height
+        rect = (glyph.bitmap, sx, sy, sx + glyph.width, sy + glyph.height)
+        glyph_cache[c] = rect
+    return rect
+
+# Digits and HUD characters are cached up front
+for _c in "0123456789/-%!Ls":
+    glyph_rect(_c)
+
+def draw_text(bmp, text, x, y):
+    """Blit text in terminalio.FONT into bmp, placed like a Label at (x, y)"""
+    # Labels put the middle of the 12px glyph cell on y
+    for c in text:
+        rect = glyph_rect(c)
+        if rect is not None:
+            src, x1, y1, x2, y2 = rect
+            bitmaptools.blit(bmp, src, x, y - 6, x1=x1, y1=y1, x2=x2, y2=y2,
+                             skip_source_index=0)
+        x += 6
+
+class TextField:
+    """Fixed-width text line drawn by blitting cached glyphs; only changed characters are redrawn"""
+    def __init__(self, x, y, width):
+        self.bitmap = displayio.Bitmap(width * 6, 12, 2)
+        self.tilegrid = displayio.TileGrid(self.bitmap, pixel_shader=TEXT_PALETTE, x=x, y=y - 6)
+        self.width = width
+        self._text = ""
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        old = self._text
+        for i in range(min(self.width, max(len(old), len(text)))):
+            c = text[i] if i < len(text) else " "
+            if c == (old[i] if i < len(old) else " "):
+                continue
+            bitmaptools.fill_region(self.bitmap, i * 6, 0, i * 6 + 6, 12, 0)
+            draw_text(self.bitmap, c, i * 6, 6)
+        self._text = text
+
+    @property
+    def x(self):
+        return self.tilegrid.x
+
+    @x.setter
+    def x(self, x):
+        self.tilegrid.x = x
+
+# Persistent menu screens: name -> {"group": Group, "menu": Menu, ...}
+menu_screens = {}
+
+# Constant text of fixed screens: (text, x or None to center, y)
+FIXED_SCREENS = {
+    "title": (
+        ("HARVEST HUSTLE", None, 12),
+        ("From Farm to Feast", None, 28),
+        ("in 90 Seconds!", None, 40),
+        ("[Press to Start]", None, 58),
+    ),
+    "over": (
+        ("GAME OVER", None, 8),
+        ("Retry Level", 36, 40),
+        ("Restart Game", 36, 54),
+    ),
+    "win": (
+        ("YOU WIN!", None, 10),
+        ("MASTER CHEF!", None, 24),
+        ("[Press Continue]", None, 56),
+    ),
+}
+
+# Print fixed_screen_cost() of each fixed screen at startup
+MEM_REPORT = False
+
+# 1-bit framebuffers of FIXED_SCREENS, composed when the screen is shown and
+# freed when it is left, so at most one frame (1 KB) is on the heap
+fixed_frames = {}
+
+def fixed_screen(name):
+    """Group showing the prerendered frame of a fixed screen, ready for overlays"""
+    bmp = fixed_frames.get(name)
+    if bmp is None:
+        bmp = displayio.Bitmap(128, 64, 2)
+        for text, x, y in FIXED_SCREENS[name]:
+            draw_text(bmp, text, center_x(text) if x is None else x, y)
+        fixed_frames[name] = bmp
+    g = displayio.Group()
+    g.append(displayio.TileGrid(bmp, pixel_shader=SHAPE_PALETTE))
+    return g
+
+def release_fixed_screens(screen):
+    """Drop the frames, and any menu built over them, of fixed screens other than screen"""
+    for name in list(fixed_frames):
+        if name != screen:
+            del fixed_frames[name]
+            menu_screens.pop(name, None)
+            if drawn_screen["key"] and drawn_screen["key"][0] == name:
+                drawn_screen["key"] = None
+                drawn_screen["group"] = None
+
+def fixed_screen_cost(name):
+    """Heap bytes (gc.mem_free() deltas) of a fixed screen as one frame vs as Labels"""
+    release_fixed_screens(None)
+    gc.collect()
+    free = gc.mem_free()
+    g = fixed_screen(name)
+    gc.collect()
+    frame = free - gc.mem_free()
+    g = None
+    release_fixed_screens(None)
+    gc.collect()
+    free = gc.mem_free()
+    g = displayio.Group()
+    for text, x, y in FIXED_SCREENS[name]:
+        g.append(make_label(text, center_x(text) if x is None else x, y))
+    gc.collect()
+    labels = free - gc.mem_free()
+    return frame, labels
+
+# Menu screen currently on the display and the inputs it was drawn from
+drawn_screen = {"key": None, "group": None}
+
+def screen_changed(key):
+    """True if the menu screen described by key is not what is on the display"""
+    return key != drawn_screen["key"] or display.root_group is not drawn_screen["group"]
+
+def show_screen(g, key):
+    """Put a menu screen on the display and remember what it was drawn from"""
+    display.root_group = g
+    drawn_screen["key"] = key
+    drawn_screen["group"] = g
+
+class Menu:
+    """Cursor menu whose rows are built once; select() only moves the "> " cursor,
+    rewriting row text just when a list longer than rows scrolls its window"""
+    def __init__(self, group, count, x, y, spacing, rows=None, text=None):
+        self.count = count
+        self.rows = min(rows or count, count)
+        self.y = y
+        self.spacing = spacing
+        self.text = text  # text(i) for item i, or None if rows are prerendered
+        self.top = 0
+        self.labels = []
+        if text:
+            for r in range(self.rows):
+                lbl = make_label(text(r), x + 12, y + r * spacing)
+                group.append(lbl)
+                self.labels.append(lbl)
+        self.cursor = make_label(">", x, y)
+        group.append(self.cursor)
+        # Scroll indicators
+        self.more_up = make_label("^", 120, y)
+        self.more_down = make_label("v", 120, y + (self.rows - 1) * spacing)
+        self.more_up.hidden = True
+        self.more_down.hidden = self.rows >= count
+        group.append(self.more_up)
+        group.append(self.more_down)
+
+    def select(self, idx):
+        top = max(0, min(idx - 1, self.count - self.rows))
+        if top != self.top:
+            self.top = top
+            for r, lbl in enumerate(self.labels):
+                lbl.text = self.text(top + r)
+            self.more_up.hidden = top == 0
+            self.more_down.hidden = top + self.rows >= self.count
+        self.cursor.y = self.y + (idx - top) * self.spacing
+
 
 # ============================================
 # SCREENS
 # ============================================
 def show_title():
-    g = displayio.Group()
-    t1 = "HARVEST HUSTLE"
-    g.append(label.Label(terminalio.FONT, text=t1, color=0xFFFFFF, x=center_x(t1), y=12))
-    t2 = "From Farm to Feast"
-    g.append(label.Label(terminalio.FONT, text=t2, color=0xFFFFFF, x=center_x(t2), y=28))
-    t3 = "in 90 Seconds!"
-    g.append(label.Label(terminalio.FONT, text=t3, color=0xFFFFFF, x=center_x(t3), y=40))
-    t4 = "[Press to Start]"
-    g.append(label.Label(terminalio.FONT, text=t4, color=0xFFFFFF, x=center_x(t4), y=58))
-    display.root_group = g
+    key = ("title",)
+    if not screen_changed(key):
+        return
+    show_screen(fixed_screen("title"), key)
 
 def show_mode():
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="SELECT MODE", color=0xFFFFFF, x=30, y=6))
-    modes = ["EASY 90s", "MEDIUM 60s", "HARD 45s"]
-    # Uniform spacing of 12: y=18, 30, 42, 54
-    for i, m in enumerate(modes):
-        pre = "> " if i == game.diff_idx else "  "
-        g.append(label.Label(terminalio.FONT, text=pre + m, color=0xFFFFFF, x=20, y=18 + i*12))
-    g.append(label.Label(terminalio.FONT, text="[Rotate & Press]", color=0xFFFFFF, x=12, y=54))
-    display.root_group = g
+    key = ("mode", game.diff_idx)
+    if not screen_changed(key):
+        return
+    scr = menu_screens.get("mode")
+    if scr is None:
+        g = displayio.Group()
+        g.append(make_label("SELECT MODE", 30, 6))
+        modes = ["EASY 90s", "MEDIUM 60s", "HARD 45s"]
+        # Uniform spacing of 12: y=18, 30, 42, 54
+        menu = Menu(g, len(modes), 20, 18, 12, text=modes.__getitem__)
+        g.append(make_label("[Rotate & Press]", 12, 54))
+        scr = menu_screens["mode"] = {"group": g, "menu": menu}
+    scr["menu"].select(game.diff_idx)
+    show_screen(scr["group"], key)
 
 def show_level_select():
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="SELECT LEVEL", color=0xFFFFFF, x=28, y=5))
-    
-    # Show 4 levels at a time with scrolling
-    total_levels = len(LEVELS)
-    start_idx = max(0, min(game.level_select_idx - 1, total_levels - 4))
-    end_idx = min(start_idx + 4, total_levels)
-    
-    # Levels at y=16, 26, 36, 46 (spacing 10)
-    y = 16
-    for i in range(start_idx, end_idx):
-        lv = LEVELS[i]
-        pre = "> " if i == game.level_select_idx else "  "
-        # Show level number and name
-        name = lv['name']
-        if len(name) > 12:
-            name = name[:11] + "."
-        txt = f"{pre}L{i+1}:{name}"
-        g.append(label.Label(terminalio.FONT, text=txt, color=0xFFFFFF, x=4, y=y))
-        y += 10
-    
-    # Scroll indicators
-    if start_idx > 0:
-        g.append(label.Label(terminalio.FONT, text="^", color=0xFFFFFF, x=120, y=16))
-    if end_idx < total_levels:
-        g.append(label.Label(terminalio.FONT, text="v", color=0xFFFFFF, x=120, y=46))
-    
-    # Button at y=56 (spacing 10 from last level at y=46)
-    g.append(label.Label(terminalio.FONT, text="[Rotate & Press]", color=0xFFFFFF, x=12, y=56))
-    display.root_group = g
+    key = ("level_select", game.level_select_idx)
+    if not screen_changed(key):
+        return
+    scr = menu_screens.get("level_select")
+    if scr is None:
+        g = displayio.Group()
+        g.append(make_label("SELECT LEVEL", 28, 5))
+        # Show 4 levels at a time with scrolling, at y=16, 26, 36, 46 (spacing 10)
+        menu = Menu(g, len(LEVELS), 4, 16, 10, rows=4, text=level_text)
+        # Button at y=56 (spacing 10 from last level at y=46)
+        g.append(make_label("[Rotate & Press]", 12, 56))
+        scr = menu_screens["level_select"] = {"group": g, "menu": menu}
+    scr["menu"].select(game.level_select_idx)
+    show_screen(scr["group"], key)
+
+def level_text(i):
+    # Show level number and name
+    name = LEVELS[i]['name']
+    if len(name) > 12:
+        name = name[:11] + "."
+    return f"L{i+1}:{name}"
 
 def get_method_text(method):
     if method == "tilt":
@@ -997,28 +1583,29 @@ def get_method_text(method):
 
 def show_intro():
     lv = LEVELS[game.level]
-    g = displayio.Group()
-    
     num_ings = len(lv["ingredients"])
+    has_more_pages = num_ings > 3 and game.intro_page == 0
+    
+    key = ("intro", game.level, game.intro_page)
+    if not screen_changed(key):
+        return has_more_pages
+    g = displayio.Group()
     
     # Title
     lt = f"LEVEL {game.level+1}"
-    g.append(label.Label(terminalio.FONT, text=lt, color=0xFFFFFF, x=center_x(lt), y=5))
-    g.append(label.Label(terminalio.FONT, text=lv["name"], color=0xFFFFFF, x=center_x(lv["name"]), y=16))
+    g.append(make_label(lt, center_x(lt), 5))
+    g.append(make_label(lv["name"], center_x(lv["name"]), 16))
     
     # Determine which ingredients to show based on page
     if num_ings <= 3:
         # Show all on one page
         ings_to_show = lv["ingredients"]
-        has_more_pages = False
     else:
         # 4 ingredients - split into 2 pages
         if game.intro_page == 0:
             ings_to_show = lv["ingredients"][:2]
-            has_more_pages = True
         else:
             ings_to_show = lv["ingredients"][2:]
-            has_more_pages = False
     
     # Calculate spacing - uniform between all items including Press Start
     if len(ings_to_show) == 2:
@@ -1034,15 +1621,14 @@ def show_intro():
     # Show ingredients
     y = start_y
     for ing, cnt, method in ings_to_show:
-        icon_bmp, icon_pal = make_icon(ing)
         mt = get_method_text(method)
         ing_cap = ing[0].upper() + ing[1:]
         txt = f"{ing_cap}x{cnt}({mt})"
         tw = 10 + len(txt) * 6
         sx = (128 - tw) // 2
         
-        g.append(displayio.TileGrid(icon_bmp, pixel_shader=icon_pal, x=sx, y=y))
-        g.append(label.Label(terminalio.FONT, text=txt, color=0xFFFFFF, x=sx+10, y=y+4))
+        g.append(make_icon(ing, sx, y))
+        g.append(make_label(txt, sx+10, y+4))
         y += spacing
     
     # Bottom text - positioned with same spacing after last ingredient
@@ -1052,97 +1638,83 @@ def show_intro():
         txt = "[Press Start]"
     
     btn_y = y + 4  # Same offset as ingredient text (y+4)
-    g.append(label.Label(terminalio.FONT, text=txt, color=0xFFFFFF, x=center_x(txt), y=btn_y))
+    g.append(make_label(txt, center_x(txt), btn_y))
     
     # Page indicator for multi-page
     if num_ings > 3:
         pg_txt = f"({game.intro_page+1}/2)"
-        g.append(label.Label(terminalio.FONT, text=pg_txt, color=0xFFFFFF, x=100, y=5))
+        g.append(make_label(pg_txt, 100, 5))
     
-    display.root_group = g
+    show_screen(g, key)
     return has_more_pages
 
-def show_game():
-    lv = LEVELS[game.level]
-    g = displayio.Group()
-    
-    # Status
-    st = f"L{game.level+1} {int(game.time_left)}s"
-    g.append(label.Label(terminalio.FONT, text=st, color=0xFFFFFF, x=0, y=6))
-    if game.penalty > 0:
-        g.append(label.Label(terminalio.FONT, text=f"-{game.penalty}", color=0xFFFFFF, x=100, y=6))
-    
+# Persistent play screen, built once per level by build_play_scene()
+play_scene = {}
+
+def render_background(lv):
+    """Draw everything static in a level (ground or border, waves) into one bitmap"""
+    bmp = displayio.Bitmap(128, 64, 2)
+    if lv["view"] == "side":
+        # Ground
+        bitmaptools.fill_region(bmp, 0, 52, 128, 54, 1)
+    else:
+        # Border
+        bitmaptools.fill_region(bmp, 0, 10, 128, 52, 1)
+        bitmaptools.fill_region(bmp, 1, 11, 127, 51, 0)
+
     # Waves
     if lv.get("waves"):
+        wi = icon_index("wave") * 8
         for wy in game.waves_y:
             for wx in range(0, 128, 16):
-                wb, wp = make_icon("wave")
-                g.append(displayio.TileGrid(wb, pixel_shader=wp, x=wx, y=wy))
-    
+                bitmaptools.blit(bmp, ICON_ATLAS, wx, wy, x1=wi, y1=0, x2=wi + 8, y2=8)
+    return bmp
+
+def build_play_scene():
+    """Build the play screen Group once; show_game() only updates it"""
+    lv = LEVELS[game.level]
+    g = displayio.Group()
+    play_scene.clear()
+    play_scene["group"] = g
+    play_scene["shown"] = {}
+    g.append(displayio.TileGrid(render_background(lv), pixel_shader=SHAPE_PALETTE))
+
+    # Status
+    play_scene["status"] = TextField(0, 6, 8)
+    g.append(play_scene["status"].tilegrid)
+    play_scene["penalty"] = TextField(100, 6, 4)
+    g.append(play_scene["penalty"].tilegrid)
+
+    # Player shapes are positioned relative to the player Group
+    player = displayio.Group()
     if lv["view"] == "side":
-        # Ground
-        bmp, pal = make_rect(128, 2)
-        g.append(displayio.TileGrid(bmp, pixel_shader=pal, x=0, y=52))
-        
-        # Animals
-        for a in game.animals:
-            ab, ap = make_icon(a["type"])
-            g.append(displayio.TileGrid(ab, pixel_shader=ap, x=int(a["x"])-4, y=int(a["y"])-4))
-        
         # Player basket
-        bmp, pal = make_rect(10, 5)
-        g.append(displayio.TileGrid(bmp, pixel_shader=pal, x=game.px-5, y=45))
-        b2, p2 = make_rect(2, 8)
-        g.append(displayio.TileGrid(b2, pixel_shader=p2, x=game.px-5, y=40))
-        b3, p3 = make_rect(2, 8)
-        g.append(displayio.TileGrid(b3, pixel_shader=p3, x=game.px+3, y=40))
+        player.append(make_box(-5, 5, 10, 5))
+        player.append(make_box(-5, 0, 2, 8))
+        player.append(make_box(3, 0, 2, 8))
     else:
-        # Border
-        bmp, pal = make_rect(128, 42, False)
-        g.append(displayio.TileGrid(bmp, pixel_shader=pal, x=0, y=10))
-        
-        # Animals
-        for a in game.animals:
-            ab, ap = make_icon(a["type"])
-            g.append(displayio.TileGrid(ab, pixel_shader=ap, x=int(a["x"])-4, y=int(a["y"])-4))
-        
-        # Trees
-        for t in game.trees:
-            if t["visible"]:
-                tb, tp = make_icon("tree")
-                g.append(displayio.TileGrid(tb, pixel_shader=tp, x=int(t["x"])-4, y=int(t["y"])-4))
-        
-        # Player
-        px = max(12, min(116, game.px))
-        py = max(16, min(46, game.py))
-        bmp, pal = make_rect(7, 3)
-        g.append(displayio.TileGrid(bmp, pixel_shader=pal, x=px-3, y=py-1))
-        b2, p2 = make_rect(3, 7)
-        g.append(displayio.TileGrid(b2, pixel_shader=p2, x=px-1, y=py-3))
-    
-    # Items
-    for it in game.items:
-        ib, ip = make_icon(it["name"])
-        g.append(displayio.TileGrid(ib, pixel_shader=ip, x=int(it["x"])-4, y=int(it["y"])-4))
-    
+        # Player cross
+        player.append(make_box(-3, -1, 7, 3))
+        player.append(make_box(-1, -3, 3, 7))
+
+    # Sprite pools: one TileGrid slot per entity, grown on demand
+    for key in ("animals", "trees"):
+        play_scene[key] = displayio.Group()
+        g.append(play_scene[key])
+    play_scene["player"] = player
+    g.append(player)
+    play_scene["items"] = displayio.Group()
+    g.append(play_scene["items"])
+
     # Touch progress - fixed at top right corner
-    if game.touch_target:
-        prog = min(1.0, (time.monotonic() - game.touch_start) / TOUCH_TIME)
-        # Background bar (outline)
-        bb_bg, bp_bg = make_rect(22, 5, False)
-        g.append(displayio.TileGrid(bb_bg, pixel_shader=bp_bg, x=104, y=0))
-        # Progress bar (filled)
-        bw = int(20 * prog)
-        if bw > 1:
-            bb, bp = make_rect(bw, 3)
-            g.append(displayio.TileGrid(bb, pixel_shader=bp, x=105, y=1))
-    
+    play_scene["touch"] = ProgressBar(104, 0, 22, 5, 1, min_fill=1)
+    play_scene["touch"].tilegrid.hidden = True
+    g.append(play_scene["touch"].tilegrid)
+
     # Rotate progress
-    if game.rotate_target:
-        rotate_needed = lv.get("rotate_needed", ROTATE_NEEDED)
-        txt = f"Rotate!{game.rotate_count}/{rotate_needed}"
-        g.append(label.Label(terminalio.FONT, text=txt, color=0xFFFFFF, x=35, y=6))
-    
+    play_scene["rotate"] = TextField(35, 6, 10)
+    g.append(play_scene["rotate"].tilegrid)
+
     # Collection progress - adaptive spacing for 3 or 4 ingredients
     num_ings = len(lv["ingredients"])
     if num_ings <= 3:
@@ -1151,20 +1723,127 @@ def show_game():
     else:
         spacing = 31  # Tighter for 4 items
         start_x = 0
-    
+
+    counters = []
     x = start_x
     for ing, need, _ in lv["ingredients"]:
-        got = game.collected.get(ing, 0)
-        ib, ip = make_icon(ing)
-        g.append(displayio.TileGrid(ib, pixel_shader=ip, x=x, y=55))
-        g.append(label.Label(terminalio.FONT, text=f"{got}/{need}", color=0xFFFFFF, x=x+9, y=60))
+        g.append(make_icon(ing, x, 55))
+        field = TextField(x+9, 60, 5)
+        g.append(field.tilegrid)
+        counters.append(field)
         x += spacing
-    
+    play_scene["counters"] = counters
+
+def hud_changed(name, value):
+    """True if a HUD field's value differs from what it currently shows; remembers value"""
+    shown = play_scene["shown"]
+    if name in shown and shown[name] == value:
+        return False
+    shown[name] = value
+    return True
+
+def sync_sprites(key, entities, now, name_key=None, name="default"):
+    """Move the pooled TileGrids in play_scene[key] onto entities, hiding spare slots"""
+    group = play_scene[key]
+    blink_off = int(now * 8) % 2 == 1
+    for i, e in enumerate(entities):
+        if name_key:
+            name = e[name_key]
+        if i == len(group):
+            group.append(make_icon(name))
+        tg = group[i]
+        idx = icon_index(name)
+        if tg[0] != idx:
+            tg[0] = idx
+        tg.x = int(e["x"]) - 4
+        tg.y = int(e["y"]) - 4
+        hidden = not e.get("visible", True)
+        # Timed items blink during their last second
+        if "lifetime" in e and now - e["timer"] > e["lifetime"] - 1.0:
+            hidden = blink_off
+        tg.hidden = hidden
+    for i in range(len(entities), len(group)):
+        group[i].hidden = True
+
+def show_game():
+    lv = LEVELS[game.level]
+    g = play_scene["group"]
+
+    # Status
+    secs = int(game.time_left)
+    if hud_changed("status", secs):
+        play_scene["status"].text = f"L{game.level+1} {secs}s"
+    if hud_changed("penalty", game.penalty):
+        pen = play_scene["penalty"]
+        pen.tilegrid.hidden = game.penalty <= 0
+        if game.penalty > 0:
+            pen.text = f"-{game.penalty}"
+
+    now = time.monotonic()
+    sync_sprites("animals", game.animals, now, "type")
+    sync_sprites("trees", game.trees, now, name="tree")
+    sync_sprites("items", game.items, now, "name")
+
+    # Player
+    player = play_scene["player"]
+    if lv["view"] == "side":
+        player.x = int(game.px)
+        player.y = 40
+    else:
+        player.x = int(max(12, min(116, game.px)))
+        player.y = int(max(16, min(46, game.py)))
+
+    # Touch progress
+    bar = play_scene["touch"]
+    bar.tilegrid.hidden = not game.touch_target
+    if game.touch_target:
+        bar.set((time.monotonic() - game.touch_start) / TOUCH_TIME)
+    else:
+        bar.set(0)
+
+    # Rotate progress (-1 while no rotate item is targeted)
+    if hud_changed("rotate", game.rotate_count if game.rotate_target else -1):
+        rot_lbl = play_scene["rotate"]
+        rot_lbl.tilegrid.hidden = not game.rotate_target
+        if game.rotate_target:
+            rotate_needed = lv.get("rotate_needed", ROTATE_NEEDED)
+            rot_lbl.text = f"Rotate!{game.rotate_count}/{rotate_needed}"
+
+    # Collection progress
+    for i, (ing, need, _) in enumerate(lv["ingredients"]):
+        got = game.collected.get(ing, 0)
+        if hud_changed(ing, got):
+            play_scene["counters"][i].text = f"{got}/{need}"
+
+    if display.root_group is not g:
+        display.root_group = g
+
+# Persistent cooking screen, built when the cooking phase is entered
+cook_scene = {}
+
+def build_cooking_scene():
+    g = displayio.Group()
+    cook_scene["group"] = g
+    cook_scene["name"] = make_label("", 0, 12)
+    g.append(cook_scene["name"])
+    cook_scene["inst"] = make_label("", 0, 28)
+    g.append(cook_scene["inst"])
+    cook_scene["bar"] = ProgressBar(14, 38, 100, 12, 2, min_fill=2)
+    g.append(cook_scene["bar"].tilegrid)
+    cook_scene["pct"] = TextField(0, 58, 4)
+    g.append(cook_scene["pct"].tilegrid)
+    cook_scene["shown_name"] = None
+    cook_scene["shown_progress"] = None
     display.root_group = g
 
+def set_centered(lbl, text):
+    lbl.text = text
+    lbl.x = center_x(text)
+
 def show_cooking():
     lv = LEVELS[game.level]
-    g = displayio.Group()
+    if display.root_group is not cook_scene.get("group"):
+        build_cooking_scene()
     
     cook_type = lv.get("cooking")
     cook_name = lv.get("cook_name", "Cooking...")
@@ -1175,114 +1854,127 @@ def show_cooking():
     else:
         progress = game.cook_progress
     
-    g.append(label.Label(terminalio.FONT, text=cook_name, color=0xFFFFFF, x=center_x(cook_name), y=12))
+    if cook_name != cook_scene["shown_name"]:
+        cook_scene["shown_name"] = cook_name
+        set_centered(cook_scene["name"], cook_name)
+        # Instruction
+        if cook_type == "button" or (cook_type == "double" and game.cook_progress < 100):
+            inst = "Hold button!"
+        else:
+            inst = "Rotate encoder!"
+        set_centered(cook_scene["inst"], inst)
     
-    # Instruction
-    if cook_type == "button" or (cook_type == "double" and game.cook_progress < 100):
-        inst = "Hold button!"
-    else:
-        inst = "Rotate encoder!"
-    g.append(label.Label(terminalio.FONT, text=inst, color=0xFFFFFF, x=center_x(inst), y=28))
-    
-    # Bar
-    bmp, pal = make_rect(100, 12, False)
-    g.append(displayio.TileGrid(bmp, pixel_shader=pal, x=14, y=38))
-    fw = int((progress / 100) * 96)
-    if fw > 2:
-        b2, p2 = make_rect(fw, 8)
-        g.append(displayio.TileGrid(b2, pixel_shader=p2, x=16, y=40))
-    
-    pct = f"{progress}%"
-    g.append(label.Label(terminalio.FONT, text=pct, color=0xFFFFFF, x=center_x(pct), y=58))
-    display.root_group = g
+    if progress != cook_scene["shown_progress"]:
+        cook_scene["shown_progress"] = progress
+        cook_scene["bar"].set(progress / 100)
+        set_centered(cook_scene["pct"], f"{progress}%")
 
-def show_clear():
+# Persistent level-clear screen; tilt scrolling only moves its "scroll" Group
+clear_scene = {}
+
+def build_clear_scene():
     lv = LEVELS[game.level]
     g = displayio.Group()
-    scroll = game.scroll_offset
-    
-    # Check if scrolling needed
-    dish_width = len(lv["dish"]) * 6
-    needs_scroll = dish_width > 120
-    if not needs_scroll:
-        scroll = 0
+    scroller = displayio.Group()
+    g.append(scroller)
+    clear_scene["group"] = g
+    clear_scene["scroll"] = scroller
     
     ct = "LEVEL CLEAR!"
-    g.append(label.Label(terminalio.FONT, text=ct, color=0xFFFFFF, x=center_x(ct)-scroll, y=8))
+    scroller.append(make_label(ct, center_x(ct), 8))
     
     # Level score
     score_txt = f"+{game.level_score}pts"
-    g.append(label.Label(terminalio.FONT, text=score_txt, color=0xFFFFFF, x=center_x(score_txt)-scroll, y=20))
+    scroller.append(make_label(score_txt, center_x(score_txt), 20))
     
     # Icons
     ings = lv["ingredients"]
     tw = len(ings) * 12
-    sx = (128 - tw) // 2 - scroll
+    sx = (128 - tw) // 2
     for ing, _, _ in ings:
-        ib, ip = make_icon(ing)
-        g.append(displayio.TileGrid(ib, pixel_shader=ip, x=sx, y=30))
+        scroller.append(make_icon(ing, sx, 30))
         sx += 12
     
     # Dish name
     dish = lv["dish"]
-    g.append(label.Label(terminalio.FONT, text=dish, color=0xFFFFFF, x=center_x(dish)-scroll, y=46))
+    scroller.append(make_label(dish, center_x(dish), 46))
     
-    g.append(label.Label(terminalio.FONT, text="[Press Next]", color=0xFFFFFF, x=28, y=58))
+    g.append(make_label("[Press Next]", 28, 58))
     display.root_group = g
+
+def show_clear():
+    lv = LEVELS[game.level]
+    if display.root_group is not clear_scene.get("group"):
+        build_clear_scene()
+    
+    # Check if scrolling needed
+    dish_width = len(lv["dish"]) * 6
+    needs_scroll = dish_width > 120
+    clear_scene["scroll"].x = -int(game.scroll_offset) if needs_scroll else 0
     return needs_scroll
 
 def show_over():
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="GAME OVER", color=0xFFFFFF, x=center_x("GAME OVER"), y=8))
+    key = ("over", game.score, game.over_choice)
+    if not screen_changed(key):
+        return
+    scr = menu_screens.get("over")
+    if scr is None:
+        g = fixed_screen("over")
+        score = make_label("", 0, 22)
+        g.append(score)
+        # Two prerendered options: Retry (0) or Restart (1)
+        menu = Menu(g, 2, 24, 40, 14)
+        scr = menu_screens["over"] = {"group": g, "menu": menu, "score": score, "shown_score": None}
     
     # Show final score
-    score_txt = f"Score: {game.score}"
-    g.append(label.Label(terminalio.FONT, text=score_txt, color=0xFFFFFF, x=center_x(score_txt), y=22))
+    if scr["shown_score"] != game.score:
+        scr["shown_score"] = game.score
+        set_centered(scr["score"], f"Score: {game.score}")
     
-    # Two options: Retry (0) or Restart (1)
-    retry_pre = "> " if game.over_choice == 0 else "  "
-    restart_pre = "> " if game.over_choice == 1 else "  "
-    
-    g.append(label.Label(terminalio.FONT, text=retry_pre + "Retry Level", color=0xFFFFFF, x=24, y=40))
-    g.append(label.Label(terminalio.FONT, text=restart_pre + "Restart Game", color=0xFFFFFF, x=24, y=54))
-    display.root_group = g
+    scr["menu"].select(game.over_choice)
+    show_screen(scr["group"], key)
 
 def show_win():
-    g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="YOU WIN!", color=0xFFFFFF, x=center_x("YOU WIN!"), y=10))
-    g.append(label.Label(terminalio.FONT, text="MASTER CHEF!", color=0xFFFFFF, x=center_x("MASTER CHEF!"), y=24))
+    key = ("win", game.score)
+    if not screen_changed(key):
+        return
+    g = fixed_screen("win")
     
     # Show final score
     score_txt = f"Final Score: {game.score}"
-    g.append(label.Label(terminalio.FONT, text=score_txt, color=0xFFFFFF, x=center_x(score_txt), y=40))
-    
-    g.append(label.Label(terminalio.FONT, text="[Press Continue]", color=0xFFFFFF, x=center_x("[Press Continue]"), y=56))
-    display.root_group = g
+    g.append(make_label(score_txt, center_x(score_txt), 40))
+    show_screen(g, key)
 
 def show_high_scores():
     """Display the high score board"""
+    key = ("highscores",)  # Board only changes on the initials screen
+    if not screen_changed(key):
+        return
     g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="HIGH SCORES", color=0xFFFFFF, x=center_x("HIGH SCORES"), y=8))
+    g.append(make_label("HIGH SCORES", center_x("HIGH SCORES"), 8))
     
     y_pos = 22
     for i, hs in enumerate(high_scores):
         rank = f"{i+1}."
         txt = f"{rank} {hs['initials']} {hs['score']:>4}"
-        g.append(label.Label(terminalio.FONT, text=txt, color=0xFFFFFF, x=30, y=y_pos))
+        g.append(make_label(txt, 30, y_pos))
         y_pos += 12
     
-    g.append(label.Label(terminalio.FONT, text="[Press Continue]", color=0xFFFFFF, x=center_x("[Press Continue]"), y=58))
-    display.root_group = g
+    g.append(make_label("[Press Continue]", center_x("[Press Continue]"), 58))
+    show_screen(g, key)
 
 def show_initials_entry():
     """Screen for entering initials for high score"""
+    key = ("enter_initials", game.score, game.initials, game.initial_char)
+    if not screen_changed(key):
+        return
     g = displayio.Group()
-    g.append(label.Label(terminalio.FONT, text="NEW HIGH SCORE!", color=0xFFFFFF, x=center_x("NEW HIGH SCORE!"), y=8))
+    g.append(make_label("NEW HIGH SCORE!", center_x("NEW HIGH SCORE!"), 8))
     
     score_txt = f"Score: {game.score}"
-    g.append(label.Label(terminalio.FONT, text=score_txt, color=0xFFFFFF, x=center_x(score_txt), y=22))
+    g.append(make_label(score_txt, center_x(score_txt), 22))
     
-    g.append(label.Label(terminalio.FONT, text="Enter Initials:", color=0xFFFFFF, x=center_x("Enter Initials:"), y=36))
+    g.append(make_label("Enter Initials:", center_x("Enter Initials:"), 36))
     
     # Display initials with cursor
     initials_display = ""
@@ -1297,67 +1989,265 @@ def show_initials_entry():
         initials_display += " "
     
     # Draw initials larger
-    g.append(label.Label(terminalio.FONT, text=initials_display, color=0xFFFFFF, x=center_x(initials_display), y=50))
+    g.append(make_label(initials_display, center_x(initials_display), 50))
     
     # Show cursor indicator
     cursor_x = center_x(initials_display) + len(game.initials) * 12
-    g.append(label.Label(terminalio.FONT, text="^", color=0xFFFFFF, x=cursor_x, y=58))
+    g.append(make_label("^", cursor_x, 58))
     
-    display.root_group = g
+    show_screen(g, key)
+
+# ============================================
+# SCREEN EFFECTS
+# ============================================
+# Effects only swap shared palette colors or toggle hidden, timed from
+# the game clock: "hit" inverts the screen, "catch" blinks the player,
+# "complete" blinks the inverted icons.
+fx_until = {"hit": 0, "catch": 0, "complete": 0}
+fx_state = {"inverted": False, "labels": []}  # Labels recolored while inverted
+
+FX_DURATION = {"hit": 0.15, "catch": 0.3, "complete": 0.6}
+
+def start_fx(name):
+    fx_until[name] = time.monotonic() + FX_DURATION[name]
+
+def invert_labels(group, found):
+    """Turn every label under group black, collecting them in found"""
+    for item in group:
+        if isinstance(item, bitmap_label.Label):
+            item.color = 0x000000
+            found.append(item)
+        elif isinstance(item, displayio.Group):
+            invert_labels(item, found)
+
+def set_inverted(inverted):
+    """Swap black and white in every shared palette and in the labels on screen"""
+    if inverted == fx_state["inverted"]:
+        return
+    fx_state["inverted"] = inverted
+    for pal in (ICON_PALETTE, SHAPE_PALETTE, TEXT_PALETTE):
+        pal[0], pal[1] = pal[1], pal[0]
+    # Each bitmap_label has its own palette; restore exactly the ones
+    # inverted, even if the screen changed in between
+    labels = fx_state["labels"]
+    if inverted:
+        if display.root_group is not None:
+            invert_labels(display.root_group, labels)
+    else:
+        for lbl in labels:
+            lbl.color = 0xFFFFFF
+        labels.clear()
+
+def update_fx(now):
+    blink_on = int(now * 20) % 2 == 1
+    set_inverted(now < fx_until["hit"] or (now < fx_until["complete"] and blink_on))
+    player = play_scene.get("player")
+    if player is not None:
+        player.hidden = now < fx_until["catch"] and blink_on
 
 # ============================================
 # NEOPIXEL
 # ============================================
+def build_wheel():
+    """256 hues around red -> green -> blue -> red"""
+    wheel = []
+    for hue in range(256):
+        if hue < 85:
+            wheel.append((255 - hue * 3, hue * 3, 0))
+        elif hue < 170:
+            hue -= 85
+            wheel.append((0, 255 - hue * 3, hue * 3))
+        else:
+            hue -= 170
+            wheel.append((hue * 3, 0, 255 - hue * 3))
+    return wheel
+
+COLOR_WHEEL = build_wheel()
+
+def build_levels(brightness, gamma):
+    """Output level for each 0-255 channel value, gamma-corrected and dimmed"""
+    return bytes(int((i / 255) ** gamma * 255 * brightness + 0.5) for i in range(256))
+
+PX_LEVEL = build_levels(0.3, 2.2)
+
+# Frame buffer: effects compose px_frame in plain colors, then px_flush()
+# corrects it and sends the whole strip with a single show()
+px_frame = [COLOR_OFF] * NUM_PIXELS
+px_sent = [COLOR_OFF] * NUM_PIXELS  # Corrected colors now on the strip
+
+def px_flush():
+    """Send the frame if any pixel's corrected color changed"""
+    changed = False
+    for i in range(NUM_PIXELS):
+        r, g, b = px_frame[i]
+        c = (PX_LEVEL[r], PX_LEVEL[g], PX_LEVEL[b])
+        if c != px_sent[i]:
+            px_sent[i] = c
+            changed = True
+    if changed:
+        pixels[0:NUM_PIXELS] = px_sent
+        pixels.show()
+
+def strip_pos(idx, count):
+    """Pixel standing for option idx of count, spread along the strip"""
+    return idx * NUM_PIXELS // count
+
+# LED effects: a timeline of (color, seconds) steps played from the game clock
+px_steps = None  # Timeline playing, or None
+px_pixel = None  # Pixel the timeline lights, or None for the whole strip
+px_step = 0
+px_step_end = 0.0
+px_shown = None  # Key of the pattern in the frame, to skip redrawing it
+
+def px_set(color, pixel=None):
+    """Light the whole strip, or one pixel of it, redrawing only on a change"""
+    global px_shown
+    key = (color, pixel)
+    if key == px_shown:
+        return
+    for i in range(NUM_PIXELS):
+        px_frame[i] = color if pixel is None or i == pixel else COLOR_OFF
+    px_flush()
+    px_shown = key
+
+def px_play(steps, pixel=None):
+    """Start a timeline, replacing any in progress; the pixels go dark after it"""
+    global px_steps, px_pixel, px_step, px_step_end
+    px_steps = steps
+    px_pixel = pixel
+    px_step = 0
+    px_step_end = time.monotonic() + steps[0][1]
+    px_set(steps[0][0], pixel)
+
+def update_px(now):
+    """Advance the timeline, once per tick"""
+    global px_steps, px_step, px_step_end
+    while px_steps is not None and now >= px_step_end:
+        px_step += 1
+        if px_step < len(px_steps):
+            color, seconds = px_steps[px_step]
+            px_step_end += seconds
+            px_set(color, px_pixel)
+        else:
+            px_steps = None
+            px_set(COLOR_OFF)
+
 def px_off():
-    pixels.fill(COLOR_OFF)
-    pixels.show()
+    global px_steps
+    px_steps = None
+    px_set(COLOR_OFF)
+
+def px_rainbow(base):
+    """Spread the color wheel along the strip, starting at hue base"""
+    global px_shown
+    if px_steps is not None:
+        return
+    key = ("rainbow", base % 256)
+    if key == px_shown:
+        return
+    for i in range(NUM_PIXELS):
+        px_frame[i] = COLOR_WHEEL[(base + i * 32) % 256]
+    px_flush()
+    px_shown = key
+
+PX_FLASH = ((COLOR_YELLOW, 0.05),)
+PX_CONFIRM = ((COLOR_GREEN, 0.1),)
+PX_SPAWN = ((COLOR_YELLOW, 0.03),)
+PX_COMPLETE = ((COLOR_RED, 0.1), (COLOR_YELLOW, 0.1), (COLOR_GREEN, 0.1),
+               (COLOR_BLUE, 0.1), (COLOR_PURPLE, 0.1))
 
 def px_success():
     """Success feedback with sound"""
-    pixels.fill(COLOR_GREEN)
-    pixels.show()
-    sound_collect()
-    pixels.fill(COLOR_OFF)
-    pixels.show()
+    px_play(((COLOR_GREEN, sound_collect()),))
 
 def px_fail():
     """Fail/Game over feedback with sound"""
-    pixels.fill(COLOR_RED)
-    pixels.show()
-    sound_game_over()
-    pixels.fill(COLOR_OFF)
-    pixels.show()
+    px_play(((COLOR_RED, sound_game_over()),))
 
 def px_spawn():
-    pixels.fill(COLOR_YELLOW)
-    pixels.show()
-    time.sleep(0.03)
-    pixels.fill(COLOR_OFF)
-    pixels.show()
+    px_play(PX_SPAWN)
 
 def px_complete():
     """Level complete feedback with sound"""
     sound_level_clear()
-    for c in [COLOR_RED, COLOR_YELLOW, COLOR_GREEN, COLOR_BLUE, COLOR_PURPLE]:
-        pixels.fill(c)
-        pixels.show()
-        time.sleep(0.1)
-    pixels.fill(COLOR_OFF)
-    pixels.show()
+    px_play(PX_COMPLETE)
 
 def px_cooking(p):
-    n = int((p / 100) * NUM_PIXELS)
+    """Fill the strip with blue up to the progress, the last pixel partly lit"""
+    global px_shown
+    if px_steps is not None:
+        return
+    key = ("cooking", p)
+    if key == px_shown:
+        return
+    lit = int(p * NUM_PIXELS * 255 / 100)  # Progress in 1/255ths of a pixel
     for i in range(NUM_PIXELS):
-        pixels[i] = COLOR_BLUE if i < n else COLOR_OFF
-    pixels.show()
+        px_frame[i] = (0, 0, max(0, min(255, lit - i * 255)))
+    px_flush()
+    px_shown = key
 
 def px_penalty():
     """Penalty feedback with sound"""
-    pixels.fill(COLOR_RED)
-    pixels.show()
-    sound_fail()
-    pixels.fill(COLOR_OFF)
-    pixels.show()
+    px_play(((COLOR_RED, sound_fail()),))
+
+# ============================================
+# COLLISIONS
+# ============================================
+# Once per frame the coarse grid cells over the 128x64 field that lie around
+# the player are stamped; squared distances are measured only for items,
+# animals and trees standing in a stamped cell, and each check then filters
+# the results by its own radius
+GRID_CELL = 16
+GRID_COLS = 128 // GRID_CELL
+GRID_ROWS = 64 // GRID_CELL
+CATCH_R2 = 12 * 12  # Catching items, danger animals
+TOUCH_R2 = 15 * 15  # Touching animals, rotate items
+SHAKE_R2 = 18 * 18  # Shaking trees, bee stings
+REACH = 18  # Largest radius above
+
+# Generation that last stamped each cell; a cell is near while it holds the
+# current one. A stale match after wraparound only costs a distance check.
+cell_gen = bytearray(GRID_COLS * GRID_ROWS)
+collide_state = {"gen": 0}
+
+# (squared distance, entity) for everything within REACH, in list order
+near_items = []
+near_animals = []
+near_trees = []
+
+def grid_col(x):
+    return max(0, min(GRID_COLS - 1, int(x) // GRID_CELL))
+
+def grid_row(y):
+    return max(0, min(GRID_ROWS - 1, int(y) // GRID_CELL))
+
+def stamp_cells():
+    """Stamp the cells within REACH of the player with a new generation"""
+    gen = collide_state["gen"] % 255 + 1
+    collide_state["gen"] = gen
+    for row in range(grid_row(game.py - REACH), grid_row(game.py + REACH) + 1):
+        for col in range(grid_col(game.px - REACH), grid_col(game.px + REACH) + 1):
+            cell_gen[row * GRID_COLS + col] = gen
+    return gen
+
+def collide_group(gen, entities, near):
+    """Keep the entities in stamped cells that are within REACH of the player"""
+    near.clear()
+    for e in entities:
+        if cell_gen[grid_row(e["y"]) * GRID_COLS + grid_col(e["x"])] != gen:
+            continue
+        dx = game.px - e["x"]
+        dy = game.py - e["y"]
+        d2 = dx*dx + dy*dy
+        if d2 < REACH * REACH:
+            near.append((d2, e))
+
+def collide():
+    """Find everything near the player, once per frame before the checks"""
+    gen = stamp_cells()
+    collide_group(gen, game.items, near_items)
+    collide_group(gen, game.animals, near_animals)
+    collide_group(gen, game.trees, near_trees)
 
 # ============================================
 # GAME LOGIC
@@ -1417,6 +2307,7 @@ def init_level():
     
     # Initial items (only tilt/shake types)
     spawn_items(lv, 2)
+    build_play_scene()
 
 def spawn_items(lv, count=1):
     spawnable = [(i, m) for i, _, m in lv["ingredients"] if m in ["tilt", "shake"]]
@@ -1564,12 +2455,8 @@ def update_trees():
 
 def check_catch(is_shake):
     caught = []
-    for it in game.items:
-        dx = game.px - it["x"]
-        dy = game.py - it["y"]
-        dist = (dx*dx + dy*dy) ** 0.5
-        
-        if dist < 12:
+    for d2, it in near_items:
+        if d2 < CATCH_R2:
             m = it.get("method", "tilt")
             if m == "tilt":
                 caught.append((it, SCORE_TILT))
@@ -1581,97 +2468,97 @@ def check_catch(is_shake):
         game.collected[it["name"]] = game.collected.get(it["name"], 0) + 1
         game.score += points
         game.level_score += points
+        start_fx("catch")
         px_success()
 
 def check_touch():
     now = time.monotonic()
     
-    for a in game.animals:
-        if a["mode"] == "danger":
+    touching = False
+    for d2, a in near_animals:
+        if a["mode"] == "danger" or d2 >= TOUCH_R2:
             continue
         
-        dx = game.px - a["x"]
-        dy = game.py - a["y"]
-        dist = (dx*dx + dy*dy) ** 0.5
-        
-        if dist < 15:
-            if game.touch_target != a:
-                game.touch_target = a
-                game.touch_start = now
-            elif now - game.touch_start >= TOUCH_TIME:
-                # Collected!
-                if a["type"] == "cow":
-                    game.collected["milk"] = game.collected.get("milk", 0) + 1
-                elif a["type"] == "pig":
-                    game.collected["bacon"] = game.collected.get("bacon", 0) + 1
-                    # Pig runs faster
-                    a["vx"] *= 1.3
-                    a["vy"] *= 1.3
-                elif a["type"] == "bee":
-                    game.collected["honey"] = game.collected.get("honey", 0) + 1
-                elif a["type"] in ["chicken", "duck", "turkey", "lamb"]:
-                    game.collected[a["type"]] = game.collected.get(a["type"], 0) + 1
-                
-                # Add touch score
-                game.score += SCORE_TOUCH
-                game.level_score += SCORE_TOUCH
-                px_success()
-                game.touch_target = None
-                game.touch_start = now
-                return
-        else:
-            if game.touch_target == a:
-                game.touch_target = None
+        touching = True
+        if game.touch_target != a:
+            game.touch_target = a
+            game.touch_start = now
+        elif now - game.touch_start >= TOUCH_TIME:
+            # Collected!
+            if a["type"] == "cow":
+                game.collected["milk"] = game.collected.get("milk", 0) + 1
+            elif a["type"] == "pig":
+                game.collected["bacon"] = game.collected.get("bacon", 0) + 1
+                # Pig runs faster
+                a["vx"] *= 1.3
+                a["vy"] *= 1.3
+            elif a["type"] == "bee":
+                game.collected["honey"] = game.collected.get("honey", 0) + 1
+            elif a["type"] in ["chicken", "duck", "turkey", "lamb"]:
+                game.collected[a["type"]] = game.collected.get(a["type"], 0) + 1
+            
+            # Add touch score
+            game.score += SCORE_TOUCH
+            game.level_score += SCORE_TOUCH
+            start_fx("catch")
+            px_success()
+            game.touch_target = None
+            game.touch_start = now
+            return
+    
+    # Walked away from every animal
+    if not touching:
+        game.touch_target = None
 
 def check_danger():
     lv = LEVELS[game.level]
-    for a in game.animals:
+    pushed = False
+    for d2, a in near_animals:
         if a["mode"] == "danger":
-            dx = game.px - a["x"]
-            dy = game.py - a["y"]
-            dist = (dx*dx + dy*dy) ** 0.5
-            if dist < 12:
+            if d2 < CATCH_R2:
                 # Shark eats fish - reduce fish count
                 if lv.get("shark_eats_fish") and game.collected.get("fish", 0) > 0:
                     game.collected["fish"] = max(0, game.collected.get("fish", 0) - 1)
                 else:
                     game.penalty += 1
+                start_fx("hit")
                 px_penalty()
                 # Push away
                 if game.px < a["x"]:
                     game.px = max(12, game.px - 15)
                 else:
                     game.px = min(116, game.px + 15)
+                pushed = True
+    
+    # Later checks see the player where the push left them
+    if pushed:
+        collide()
 
 def check_tree_shake(is_shake):
     if not is_shake:
         return
     
-    for t in game.trees:
+    for d2, t in near_trees:
         if not t["visible"]:
             continue
-        dx = game.px - t["x"]
-        dy = game.py - t["y"]
-        dist = (dx*dx + dy*dy) ** 0.5
-        if dist < 18:
+        if d2 < SHAKE_R2:
             game.collected[t["ing"]] = game.collected.get(t["ing"], 0) + 1
             t["visible"] = False
             # Tree shake is a shake collection
             game.score += SCORE_SHAKE
             game.level_score += SCORE_SHAKE
+            start_fx("catch")
             px_success()
 
 def check_bee_shake(is_shake):
     if not is_shake:
         return
     
-    for a in game.animals:
+    for d2, a in near_animals:
         if a["type"] == "bee":
-            dx = game.px - a["x"]
-            dy = game.py - a["y"]
-            dist = (dx*dx + dy*dy) ** 0.5
-            if dist < 18:
+            if d2 < SHAKE_R2:
                 game.penalty += 1
+                start_fx("hit")
                 px_penalty()
 
 def check_rotate(rot):
@@ -1686,14 +2573,11 @@ def check_rotate(rot):
     # Get rotate_needed from level config, default to 5
     rotate_needed = lv.get("rotate_needed", ROTATE_NEEDED)
     
-    for it in game.items:
+    for d2, it in near_items:
         if it.get("method") != "rotate":
             continue
-        dx = game.px - it["x"]
-        dy = game.py - it["y"]
-        dist = (dx*dx + dy*dy) ** 0.5
         
-        if dist < 15:
+        if d2 < TOUCH_R2:
             if game.rotate_target != it:
                 game.rotate_target = it
                 game.rotate_count = 0
@@ -1705,6 +2589,7 @@ def check_rotate(rot):
                 # Rotate collection - highest score
                 game.score += SCORE_ROTATE
                 game.level_score += SCORE_ROTATE
+                start_fx("catch")
                 px_success()
                 game.rotate_target = None
                 game.rotate_count = 0
@@ -1719,27 +2604,12 @@ def is_complete():
             return False
     return True
 
-def move(m, lv):
-    now = time.monotonic()
-    if now - game.last_move < MOVE_DEBOUNCE:
-        return
-    game.last_move = now
-    
-    spd = 6
-    if lv["view"] == "side":
-        if m == "LEFT":
-            game.px = max(12, game.px - spd)
-        elif m == "RIGHT":
-            game.px = min(116, game.px + spd)
-    else:
-        if m == "LEFT":
-            game.px = max(12, game.px - spd)
-        elif m == "RIGHT":
-            game.px = min(116, game.px + spd)
-        elif m == "FWD":
-            game.py = max(16, game.py - spd)
-        elif m == "BACK":
-            game.py = min(46, game.py + spd)
+def move(lv, dt):
+    """Integrate the tilt velocity over one tick; side view moves sideways only"""
+    game.px = max(12, min(116, game.px + tilt_vx * dt))
+    if lv["view"] != "side":
+        # Tilting forward (y > 0) moves up the screen
+        game.py = max(16, min(46, game.py - tilt_vy * dt))
 
 # ============================================
 # MAIN LOOP
@@ -1747,6 +2617,9 @@ def move(m, lv):
 def main():
     global first_boot, high_scores
     print("Harvest Hustle Starting...")
+    if MEM_REPORT:
+        for name in FIXED_SCREENS:
+            print(name, "frame / labels bytes:", *fixed_screen_cost(name))
     
     # Show splash screen only on first boot (power on)
     if first_boot:
@@ -1765,9 +2638,13 @@ def main():
         dt = now - last_t
         last_t = now
         
-        rot, btn = read_encoder()
-        accel = read_accel()
-        is_shake = (accel == "SHAKE")
+        poll_input()
+        rot, btn, is_shake = next_input()
+        update_fx(now)
+        update_sound(now)
+        update_px(now)
+        play_music(LEVELS[game.level]["music"] if game.screen in ("play", "cooking") else None)
+        release_fixed_screens(game.screen)
         
         if game.screen == "title":
             show_title()
@@ -1775,38 +2652,26 @@ def main():
                 sound_start()
                 px_success()
                 game.screen = "mode"
-                time.sleep(0.2)
+                wait(0.2)
         
         elif game.screen == "mode":
-            if rot > 0:
-                # Clockwise only - cycle through options
-                game.diff_idx = (game.diff_idx + 1) % 3
-                pixels[game.diff_idx] = COLOR_YELLOW
-                pixels.show()
-                time.sleep(0.05)
-                pixels.fill(COLOR_OFF)
-                pixels.show()
+            if rot:
+                # Cycle through options in either direction
+                game.diff_idx = (game.diff_idx + rot) % 3
+                px_play(PX_FLASH, strip_pos(game.diff_idx, 3))
             game.difficulty = ["EASY", "MEDIUM", "HARD"][game.diff_idx]
             show_mode()
             if btn:
-                pixels.fill(COLOR_GREEN)
-                pixels.show()
-                time.sleep(0.1)
-                pixels.fill(COLOR_OFF)
-                pixels.show()
+                px_play(PX_CONFIRM)
                 game.level_select_idx = 0
                 game.screen = "level_select"
-                time.sleep(0.2)
+                wait(0.2)
         
         elif game.screen == "level_select":
-            if rot > 0:
-                # Clockwise only - cycle through levels
-                game.level_select_idx = (game.level_select_idx + 1) % len(LEVELS)
-                pixels[game.level_select_idx % NUM_PIXELS] = COLOR_YELLOW
-                pixels.show()
-                time.sleep(0.05)
-                pixels.fill(COLOR_OFF)
-                pixels.show()
+            if rot:
+                # Cycle through levels in either direction
+                game.level_select_idx = (game.level_select_idx + rot) % len(LEVELS)
+                px_play(PX_FLASH, strip_pos(game.level_select_idx, len(LEVELS)))
             show_level_select()
             if btn:
                 sound_start()
@@ -1815,7 +2680,7 @@ def main():
                 game.scroll_offset = 0
                 game.intro_page = 0
                 game.screen = "intro"
-                time.sleep(0.3)
+                wait(0.3)
         
         elif game.screen == "intro":
             has_more_pages = show_intro()
@@ -1825,7 +2690,7 @@ def main():
                     # Go to next page
                     game.intro_page += 1
                     px_success()
-                    time.sleep(0.2)
+                    wait(0.2)
                 else:
                     # Start game
                     px_success()
@@ -1836,7 +2701,7 @@ def main():
                     spawn_timer = 0
                     tree_timer = 0
                     rotate_timer = 0
-                    time.sleep(0.3)
+                    wait(0.3)
         
         elif game.screen == "play":
             lv = LEVELS[game.level]
@@ -1849,8 +2714,7 @@ def main():
                 continue
             
             # Move
-            if accel and accel != "SHAKE":
-                move(accel, lv)
+            move(lv, dt)
             
             # Updates
             update_animals(lv, dt)
@@ -1858,6 +2722,7 @@ def main():
             update_trees()
             
             # Checks
+            collide()
             check_catch(is_shake)
             check_touch()
             check_rotate(rot)
@@ -1911,6 +2776,7 @@ def main():
                 else:
                     game.screen = "clear"
                     px_complete()
+                    start_fx("complete")
         
         elif game.screen == "cooking":
             lv = LEVELS[game.level]
@@ -1919,7 +2785,7 @@ def main():
             if cook_type == "double":
                 # First phase: button
                 if game.cook_progress < 100:
-                    if not btn_pin.value:
+                    if btn_held:
                         game.cook_progress = min(100, game.cook_progress + 2)
                 else:
                     # Second phase: rotate
@@ -1932,10 +2798,11 @@ def main():
                 if game.cook_progress2 >= 100:
                     game.screen = "clear"
                     px_complete()
-                    time.sleep(0.3)
+                    start_fx("complete")
+                    wait(0.3)
             else:
                 # Single phase: button
-                if not btn_pin.value:
+                if btn_held:
                     game.cook_progress = min(100, game.cook_progress + 2)
                 
                 px_cooking(game.cook_progress)
@@ -1944,18 +2811,14 @@ def main():
                 if game.cook_progress >= 100:
                     game.screen = "clear"
                     px_complete()
-                    time.sleep(0.3)
+                    start_fx("complete")
+                    wait(0.3)
         
         elif game.screen == "clear":
             needs_scroll = show_clear()
-            # Tilt to scroll only if needed
-            if needs_scroll and now - game.last_scroll > 0.15:
-                if accel == "LEFT":
-                    game.scroll_offset = max(-50, game.scroll_offset - 15)
-                    game.last_scroll = now
-                elif accel == "RIGHT":
-                    game.scroll_offset = min(100, game.scroll_offset + 15)
-                    game.last_scroll = now
+            # Tilt to scroll only if needed, at the tilt speed
+            if needs_scroll:
+                game.scroll_offset = max(-50, min(100, game.scroll_offset + tilt_vx * dt))
             
             if btn:
                 px_success()
@@ -1967,17 +2830,13 @@ def main():
                     game.screen = "win"
                 else:
                     game.screen = "intro"
-                time.sleep(0.3)
+                wait(0.3)
         
         elif game.screen == "over":
             # Rotate to select option
-            if rot > 0:
-                game.over_choice = (game.over_choice + 1) % 2
-                pixels[game.over_choice] = COLOR_YELLOW
-                pixels.show()
-                time.sleep(0.05)
-                pixels.fill(COLOR_OFF)
-                pixels.show()
+            if rot:
+                game.over_choice = (game.over_choice + rot) % 2
+                px_play(PX_FLASH, strip_pos(game.over_choice, 2))
             
             show_over()
             
@@ -1987,11 +2846,7 @@ def main():
                     # Retry Level - forfeit points from failed attempt
                     game.score -= game.level_score
                     sound_start()
-                    pixels.fill(COLOR_GREEN)
-                    pixels.show()
-                    time.sleep(0.1)
-                    pixels.fill(COLOR_OFF)
-                    pixels.show()
+                    px_play(PX_CONFIRM)
                     game.scroll_offset = 0
                     game.intro_page = 0
                     init_level()
@@ -1999,7 +2854,7 @@ def main():
                     spawn_timer = 0
                     tree_timer = 0
                     rotate_timer = 0
-                    time.sleep(0.2)
+                    wait(0.2)
                 else:
                     # Restart Game - check for high score first
                     game.after_highscore = "restart"
@@ -2010,23 +2865,12 @@ def main():
                         game.screen = "enter_initials"
                     else:
                         game.screen = "highscores"
-                    time.sleep(0.2)
+                    wait(0.2)
         
         elif game.screen == "win":
             show_win()
             # Rainbow LED celebration
-            for i in range(NUM_PIXELS):
-                hue = (int(time.monotonic() * 100) + i * 32) % 256
-                if hue < 85:
-                    r, g_c, b = 255 - hue * 3, hue * 3, 0
-                elif hue < 170:
-                    hue -= 85
-                    r, g_c, b = 0, 255 - hue * 3, hue * 3
-                else:
-                    hue -= 170
-                    r, g_c, b = hue * 3, 0, 255 - hue * 3
-                pixels[i] = (r, g_c, b)
-            pixels.show()
+            px_rainbow(int(now * 100))
             
             if btn:
                 # Check if this is a high score
@@ -2038,14 +2882,14 @@ def main():
                     game.screen = "enter_initials"
                 else:
                     game.screen = "highscores"
-                time.sleep(0.3)
+                wait(0.3)
         
         elif game.screen == "enter_initials":
             show_initials_entry()
             
             # Rotate to change character
-            if rot > 0:
-                game.initial_char = (game.initial_char + 1) % 26
+            if rot:
+                game.initial_char = (game.initial_char + rot) % 26
             
             # Press to confirm character
             if btn:
@@ -2058,7 +2902,7 @@ def main():
                     save_high_scores(high_scores)
                     sound_level_clear()
                     game.screen = "highscores"
-                time.sleep(0.2)
+                wait(0.2)
         
         elif game.screen == "highscores":
             show_high_scores()
@@ -2071,8 +2915,8 @@ def main():
                     game.diff_idx = 0
                 else:
                     game.reset()
-                time.sleep(0.3)
+                wait(0.3)
         
-        time.sleep(0.005)  # 5ms for better responsiveness
+        wait(0.005)  # 5ms for better responsiveness
 
 main()